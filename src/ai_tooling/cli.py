@@ -94,8 +94,6 @@ def init_feature(target_dir: str | None, file_name: str) -> None:
 @main.command("self-update")
 def self_update() -> None:
     """Update the ai-tooling CLI itself to the latest version."""
-    import subprocess
-
     from ai_tooling.install import get_repo_root
 
     try:
@@ -104,10 +102,15 @@ def self_update() -> None:
         click.echo(f"Error: {e}", err=True)
         raise click.Abort() from e
 
+    # Only pay for subprocess once there is a checkout to update
+    import subprocess
+
     click.echo("Updating ai-tooling CLI...")
 
-    # Pull latest changes
+    # Spawn commands as plain argv lists (no shell=True or preexec_fn) so subprocess can
+    # use vfork/posix_spawn instead of a full fork of the interpreter
     try:
+        # Pull latest changes
         result = subprocess.run(
             ["git", "pull", "--ff-only"],
             cwd=repo_root,
@@ -117,15 +120,16 @@ def self_update() -> None:
         )
         click.echo(result.stdout)
 
-        # Reinstall dependencies
+        # Reinstall dependencies (uv writes its progress straight to the terminal)
         click.echo("Reinstalling dependencies...")
-        subprocess.run(["uv", "sync"], cwd=repo_root, check=True, capture_output=True)
+        subprocess.run(["uv", "sync"], cwd=repo_root, check=True)
 
         click.secho("✓ ai-tooling CLI updated successfully!", fg="green")
         click.echo("\nRun 'ai-tooling update' to update your configuration files.")
 
     except subprocess.CalledProcessError as e:
-        click.echo(f"Error updating: {e.stderr}", err=True)
+        # Only git pull captures output; uv has already printed its own errors
+        click.echo(f"Error updating: {e.stderr or e}", err=True)
         raise click.Abort() from e
     except FileNotFoundError as e:
         click.echo(f"Error: Required command not found ({e.filename})", err=True)
@@ -2,22 +2,25 @@
 
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import click
 
 from ai_tooling.utils import (
-    create_metadata,
+    create_metadata_from_hashes,
     expand_path,
-    parse_markdown_sections,
+    parse_markdown_section_hashes,
     print_header,
     print_success,
 )
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
-    """Get the repository root directory."""
+    """Get the repository root directory (resolved once per process)."""
     # When installed via pip, we need to find the templates
     # Check if we're in development mode first
     current_file = Path(__file__).resolve()
@@ -35,8 +38,9 @@ def get_repo_root() -> Path:
     raise RuntimeError("Could not find AI tooling. Run bootstrap.sh first.")
 
 
+@lru_cache(maxsize=1)
 def load_tool_mappings() -> dict[str, Any]:
-    """Load tool mappings configuration."""
+    """Load tool mappings configuration (read once per process; treat as read-only)."""
     repo_root = get_repo_root()
     config_file = repo_root / "config" / "tool-mappings.json"
 
@@ -47,8 +51,49 @@ def load_tool_mappings() -> dict[str, Any]:
     return data
 
 
-def install_file(template_name: str, target_path: str) -> None:
-    """Install a configuration file from template."""
+def _enabled_tools(scope: str) -> list[dict[str, Any]]:
+    """
+    List the scope configs of enabled tools that have a target path for a scope.
+
+    Args:
+        scope: "global" or "project"
+
+    Returns:
+        List of scope configs in configuration order
+    """
+    enabled_tools = []
+
+    for tool_config in load_tool_mappings()["tools"].values():
+        if not tool_config.get("enabled", True):
+            continue
+
+        scope_config = tool_config.get(scope)
+        if not scope_config or not scope_config.get("path"):
+            continue
+
+        enabled_tools.append(scope_config)
+
+    return enabled_tools
+
+
+def get_global_targets() -> dict[str, str]:
+    """
+    Map each enabled tool's resolved global target path to its source template.
+
+    Paths are resolved through symlinks, so tools sharing one file appear once (first tool
+    wins) and concurrent installs or updates never write the same file twice.
+    """
+    templates_by_target: dict[str, str] = {}
+
+    for global_config in _enabled_tools("global"):
+        target = str(expand_path(global_config["path"]))
+        templates_by_target.setdefault(target, global_config["source_template"])
+
+    return templates_by_target
+
+
+def _install_template(template_name: str, target_path: str) -> Path:
+    """Copy a template to its target and record its section hashes; returns the target."""
     repo_root = get_repo_root()
     template_file = repo_root / "templates" / template_name
 
@@ -59,32 +104,27 @@ def install_file(template_name: str, target_path: str) -> None:
     target.parent.mkdir(parents=True, exist_ok=True)
 
     # Copy template to target
-    shutil.copy2(template_file, target)
-    print_success(f"Installed: {target}")
+    shutil.copyfile(template_file, target)
 
-    # Create metadata for tracking
-    sections = parse_markdown_sections(target)
-    create_metadata(target, sections)
+    # Create metadata for tracking (the copy is byte-identical to the template)
+    create_metadata_from_hashes(target, parse_markdown_section_hashes(template_file))
+    return target
 
 
 def install_global_files() -> None:
     """Install global configuration files."""
     print_header("Installing global configuration files...")
 
-    config = load_tool_mappings()
-
-    for _tool_name, tool_config in config["tools"].items():
-        if not tool_config.get("enabled", True):
-            continue
-
-        global_config = tool_config.get("global")
-        if not global_config or not global_config.get("path"):
-            continue
-
-        template = global_config["source_template"]
-        target_path = global_config["path"]
+    templates_by_target = get_global_targets()
 
-        install_file(template, target_path)
+    if templates_by_target:
+        # Each target is an independent file, so copy them concurrently and report in order
+        with ThreadPoolExecutor(max_workers=min(8, len(templates_by_target))) as executor:
+            targets = executor.map(
+                _install_template, templates_by_target.values(), templates_by_target.keys()
+            )
+            for target in targets:
+                print_success(f"Installed: {target}")
 
     click.echo()
 
@@ -110,12 +150,11 @@ def install_local_files(project_dir: str | None = None) -> None:
         raise FileNotFoundError(f"Template not found: {agents_template}")
 
     agents_target.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(agents_template, agents_target)
+    shutil.copyfile(agents_template, agents_target)
     print_success(f"Installed: {agents_target}")
 
     # Create metadata for AGENTS.md
-    sections = parse_markdown_sections(agents_target)
-    create_metadata(agents_target, sections)
+    create_metadata_from_hashes(agents_target, parse_markdown_section_hashes(agents_template))
 
     # Create symlinks for CLAUDE.md and GEMINI.md
     claude_target = project_path / "CLAUDE.md"
@@ -173,12 +212,11 @@ def install_feature_file(target_dir: str | None = None, file_name: str = "AGENTS
 
     # Copy template to target
     target_file.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(feature_template, target_file)
+    shutil.copyfile(feature_template, target_file)
     print_success(f"Created: {target_file}")
 
     # Create metadata for tracking
-    sections = parse_markdown_sections(target_file)
-    create_metadata(target_file, sections)
+    create_metadata_from_hashes(target_file, parse_markdown_section_hashes(feature_template))
 
     click.echo()
     print_success("Feature file initialized!")
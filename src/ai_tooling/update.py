@@ -1,103 +1,128 @@
 """Update logic for AI tooling configuration files."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
-from ai_tooling.install import get_repo_root, load_tool_mappings
+from ai_tooling.install import get_global_targets, get_repo_root
 from ai_tooling.utils import (
-    compute_section_hash,
     expand_path,
+    find_section_ranges,
     load_metadata,
-    parse_markdown_sections,
+    parse_markdown_file,
+    parse_markdown_section_hashes,
     print_header,
     print_info,
     print_success,
     print_warning,
-    update_metadata_hash,
+    read_text,
+    save_metadata,
 )
 
+# Output deferred as (printer, message) pairs so concurrent updates can report in order
+_Messages = list[tuple[Callable[[str], None], str]]
 
-def replace_section_in_file(file_path: Path, section_name: str, new_content: str) -> None:
-    """Replace a section in a markdown file with new content."""
-    if not file_path.exists():
-        return
+# Metadata key holding the hash of the template a fully up-to-date target was last checked against
+_CHECKED_TEMPLATE_KEY = "checked_template_hash"
 
-    content = file_path.read_text()
-    lines = content.split("\n")
-    new_lines = []
-    in_target_section = False
-    section_header = f"## {section_name}"
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check if this is the start of our target section
-        if line == section_header:
-            in_target_section = True
-            # Add the section header and new content
-            new_lines.append(section_header)
-            new_lines.extend(new_content.split("\n"))
-
-            # Skip to next section or H1
-            i += 1
-            while i < len(lines):
-                next_line = lines[i]
-                # Stop at next H2 or H1
-                if next_line.startswith("## ") or next_line.startswith("# "):
-                    break
-                i += 1
-            in_target_section = False
-            continue
 
-        # Keep lines that aren't in the target section
-        if not in_target_section:
-            new_lines.append(line)
+def _index_sections(lines: list[str]) -> dict[str, tuple[int, int]]:
+    """
+    Map each H2 section name to its (header_index, end_index) line range.
 
-        i += 1
+    Uses the same headers and boundaries as parse_markdown_sections(), so a repeated header
+    resolves to its last occurrence, the one whose content was hashed.
+    """
+    return {name: (start, end) for name, start, end in find_section_ranges(lines)}
 
-    file_path.write_text("\n".join(new_lines))
 
+def _replace_sections(file_path: Path, new_contents: dict[str, str]) -> bool:
+    """
+    Replace several sections in a markdown file with a single read and write.
 
-def update_file(
-    target_path: str, template_name: str, dry_run: bool = False
-) -> tuple[int, int, list[str]]:
+    Returns True if the file was rewritten, False if the new sections match what is on disk.
     """
-    Update a configuration file, preserving user modifications.
+    content = read_text(file_path)
+    lines = content.split("\n")
+    index = _index_sections(lines)
+    ranges = sorted((index[name], name) for name in new_contents if name in index)
 
-    Returns:
-        Tuple of (updated_sections, skipped_sections, skipped_names)
+    new_lines: list[str] = []
+    pos = 0
+    for (start, end), section_name in ranges:
+        # Keep everything up to and including the header, then swap in the new body
+        new_lines.extend(lines[pos : start + 1])
+        new_lines.extend(new_contents[section_name].split("\n"))
+        pos = end
+    new_lines.extend(lines[pos:])
+
+    new_content = "\n".join(new_lines)
+    if new_content == content:
+        return False
+
+    file_path.write_text(new_content)
+    return True
+
+
+def replace_section_in_file(file_path: Path, section_name: str, new_content: str) -> None:
+    """Replace a section in a markdown file with new content.
+
+    A single-section form of _replace_sections(), sharing its header and boundary rules.
     """
+    if not file_path.exists():
+        return
+
+    _replace_sections(file_path, {section_name: new_content})
+
+
+def _update_file(
+    target_path: str, template_name: str, dry_run: bool, messages: _Messages
+) -> tuple[int, int, list[str]]:
+    """Update a configuration file, appending its output to messages instead of printing."""
     target = expand_path(target_path)
 
     # Check if target exists
     if not target.exists():
-        print_warning(f"Target file not found: {target} (skipping)")
+        messages.append((print_warning, f"Target file not found: {target} (skipping)"))
         return 0, 0, []
 
     # Check if metadata exists
     metadata = load_metadata(target)
     if metadata is None:
-        print_warning(f"No metadata found for {target} (skipping - was it installed manually?)")
+        messages.append(
+            (
+                print_warning,
+                f"No metadata found for {target} (skipping - was it installed manually?)",
+            )
+        )
         return 0, 0, []
 
-    print_info(f"Checking {target}...")
+    messages.append((print_info, f"Checking {target}..."))
 
     repo_root = get_repo_root()
     template_file = repo_root / "templates" / template_name
 
     if not template_file.exists():
-        print_warning(f"Template not found: {template_file}")
+        messages.append((print_warning, f"Template not found: {template_file}"))
+        return 0, 0, []
+
+    # One read of the template, so its hash always matches the sections being applied
+    template_hash, template_sections, template_hashes = parse_markdown_file(template_file)
+
+    # Only recorded after a check with nothing skipped or new, so every section already matches
+    if metadata.get(_CHECKED_TEMPLATE_KEY) == template_hash:
+        messages.append((print_info, "  Up to date (template unchanged since last update)"))
         return 0, 0, []
 
-    # Parse both files
-    template_sections = parse_markdown_sections(template_file)
-    current_sections = parse_markdown_sections(target)
+    current_hashes = parse_markdown_section_hashes(target)
 
     updated_count = 0
     skipped_count = 0
     skipped_names = []
+    new_sections = False
+    pending_updates: dict[str, str] = {}
 
     for section_name, template_content in template_sections.items():
         # Get original hash from metadata
@@ -105,62 +130,104 @@ def update_file(
 
         if original_hash is None:
             # New section in template
-            print_info(f"  New section found: {section_name}")
+            messages.append((print_info, f"  New section found: {section_name}"))
+            new_sections = True
             continue
 
-        # Compute current hash
-        current_content = current_sections.get(section_name, "")
-        current_hash = compute_section_hash(current_content)
+        # A section removed from the target can't be spliced, so it counts as user-modified
+        current_hash = current_hashes.get(section_name)
 
-        if current_hash == original_hash:
+        if current_hash is not None and current_hash == original_hash:
             # Section unchanged, update it
             if dry_run:
-                print_success(f"  Would update: {section_name}")
+                messages.append((print_success, f"  Would update: {section_name}"))
                 updated_count += 1
             else:
-                replace_section_in_file(target, section_name, template_content)
-                # Update metadata with new hash
-                new_hash = compute_section_hash(template_content)
-                update_metadata_hash(target, section_name, new_hash)
+                # Collect updates so the target and metadata are each written once
+                pending_updates[section_name] = template_content
+                metadata["sections"][section_name] = template_hashes[section_name]
                 updated_count += 1
         else:
             # Section modified by user, skip it
             skipped_count += 1
             skipped_names.append(section_name)
 
+    if not dry_run:
+        # Unchanged sections are re-applied on every run; skip rewriting when nothing differs
+        rewritten = bool(pending_updates) and _replace_sections(target, pending_updates)
+
+        # Skipped or new sections may still need attention later, so keep checking those files
+        checked_template = metadata.pop(_CHECKED_TEMPLATE_KEY, None)
+        if skipped_count == 0 and not new_sections:
+            metadata[_CHECKED_TEMPLATE_KEY] = template_hash
+
+        if rewritten or metadata.get(_CHECKED_TEMPLATE_KEY) != checked_template:
+            save_metadata(target, metadata)
+
     return updated_count, skipped_count, skipped_names
 
 
+def update_file(
+    target_path: str, template_name: str, dry_run: bool = False
+) -> tuple[int, int, list[str]]:
+    """
+    Update a configuration file, preserving user modifications.
+
+    Returns:
+        Tuple of (updated_sections, skipped_sections, skipped_names)
+    """
+    messages: _Messages = []
+    result = _update_file(target_path, template_name, dry_run, messages)
+    for printer, message in messages:
+        printer(message)
+    return result
+
+
 def update_global_files(dry_run: bool = False) -> None:
     """Update global configuration files."""
     print_header("Checking global configuration files...")
 
-    config = load_tool_mappings()
+    templates_by_target = get_global_targets()
 
-    for _tool_name, tool_config in config["tools"].items():
-        if not tool_config.get("enabled", True):
-            continue
-
-        global_config = tool_config.get("global")
-        if not global_config or not global_config.get("path"):
-            continue
-
-        template = global_config["source_template"]
-        target_path = global_config["path"]
+    if not templates_by_target:
+        return
 
-        updated, skipped, skipped_names = update_file(target_path, template, dry_run)
+    # Each target is an independent file, so update them concurrently and report in order
+    target_messages: list[_Messages] = [[] for _ in templates_by_target]
+    with ThreadPoolExecutor(max_workers=min(8, len(templates_by_target))) as executor:
+        results = executor.map(
+            _update_file,
+            templates_by_target.keys(),
+            templates_by_target.values(),
+            [dry_run] * len(templates_by_target),
+            target_messages,
+        )
+        for target_path, messages, result in zip(
+            templates_by_target, target_messages, results, strict=True
+        ):
+            _report_global_update(target_path, messages, result, dry_run)
+
+
+def _report_global_update(
+    target_path: str, messages: _Messages, result: tuple[int, int, list[str]], dry_run: bool
+) -> None:
+    """Print the deferred output and summary for one global file update."""
+    for printer, message in messages:
+        printer(message)
+
+    updated, skipped, skipped_names = result
 
-        if updated > 0:
-            if dry_run:
-                print_info(f"Would update {updated} section(s) in {expand_path(target_path)}")
-            else:
-                print_success(f"Updated {updated} section(s) in {expand_path(target_path)}")
+    if updated > 0:
+        if dry_run:
+            print_info(f"Would update {updated} section(s) in {expand_path(target_path)}")
+        else:
+            print_success(f"Updated {updated} section(s) in {expand_path(target_path)}")
 
-        if skipped > 0:
-            skipped_list = "\n    - ".join(skipped_names)
-            print_warning(f"Skipped {skipped} modified section(s):\n    - {skipped_list}")
+    if skipped > 0:
+        skipped_list = "\n    - ".join(skipped_names)
+        print_warning(f"Skipped {skipped} modified section(s):\n    - {skipped_list}")
 
-        click.echo()
+    click.echo()
 
 
 def update_local_files(project_dir: str | None = None, dry_run: bool = False) -> None:
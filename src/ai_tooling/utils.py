@@ -2,13 +2,16 @@
 
 import hashlib
 import json
-import re
-from datetime import datetime
+import os
+import time
 from pathlib import Path
 from typing import Any
 
 import click
 
+# Parsed (sections, section hashes) keyed by a SHA256 digest of the file's raw bytes
+_SECTION_CACHE: dict[str, tuple[dict[str, str], dict[str, str]]] = {}
+
 
 def expand_path(path: str) -> Path:
     """Expand ~ and environment variables in path."""
@@ -20,84 +23,164 @@ def compute_section_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
-def parse_markdown_sections(file_path: Path) -> dict[str, str]:
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 bytes with line endings normalized to \n."""
+    content = data.decode("utf-8")
+    # Decoding bytes skips the universal-newlines layer, so normalize only when needed
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def read_text(file_path: Path) -> str:
+    """Read a UTF-8 text file with line endings normalized to \n."""
+    return _decode_text(file_path.read_bytes())
+
+
+def _atomic_write_text(path: Path, data: str) -> None:
+    """Write text via a temporary sibling file so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data.encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
+def _is_section_header(line: str) -> bool:
+    """Check whether a line is a tracked H2 header ("## " followed by a word character)."""
+    return len(line) > 3 and line[:3] == "## " and (line[3].isalnum() or line[3] == "_")
+
+
+def find_section_ranges(lines: list[str]) -> list[tuple[str, int, int]]:
     """
-    Parse markdown file into sections based on H2 headers (##).
+    Locate the H2 sections in a file's lines.
 
-    Returns dict mapping section names to their content (excluding the header itself).
+    Returns (section_name, header_index, end_index) triples in file order, where each section
+    runs until the next H2 header or the end of the file.
     """
-    if not file_path.exists():
-        return {}
+    section_starts = [
+        (i, line[3:].strip())  # Remove "## "
+        for i, line in enumerate(lines)
+        if _is_section_header(line)
+    ]
+    # Each section ends where the next one starts, the last one at end of file
+    boundaries = [start for start, _ in section_starts] + [len(lines)]
+
+    return [
+        (section_name, start, end)
+        for (start, section_name), end in zip(section_starts, boundaries[1:], strict=True)
+    ]
+
+
+def _parse_sections(file_path: Path) -> tuple[str, dict[str, str], dict[str, str]]:
+    """Parse a markdown file into its hash, H2 sections and their hashes, cached by content."""
+    try:
+        data = file_path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return "", {}, {}
 
-    content = file_path.read_text()
+    # Keyed on the bytes just read, so a rewrite is never missed however coarse mtimes are
+    file_hash = hashlib.sha256(data).hexdigest()
+    cached = _SECTION_CACHE.get(file_hash)
+    if cached is not None:
+        return file_hash, *cached
+
+    lines = _decode_text(data).split("\n")
     sections: dict[str, str] = {}
-    current_section: str | None = None
-    current_content: list[str] = []
+    section_hashes: dict[str, str] = {}
+
+    for section_name, start, end in find_section_ranges(lines):
+        content = "\n".join(lines[start + 1 : end])
+        sections[section_name] = content
+        section_hashes[section_name] = compute_section_hash(content)
 
-    for line in content.split("\n"):
-        # Check for H2 header (## heading)
-        if re.match(r"^## \w", line):
-            # Save previous section
-            if current_section is not None:
-                sections[current_section] = "\n".join(current_content)
+    _SECTION_CACHE[file_hash] = (sections, section_hashes)
+    return file_hash, sections, section_hashes
 
-            # Start new section
-            current_section = line[3:].strip()  # Remove "## "
-            current_content = []
-        elif current_section is not None:
-            current_content.append(line)
 
-    # Save final section
-    if current_section is not None:
-        sections[current_section] = "\n".join(current_content)
+def parse_markdown_file(file_path: Path) -> tuple[str, dict[str, str], dict[str, str]]:
+    """
+    Parse markdown file into its hash, sections and section hashes from a single read.
 
-    return sections
+    Returns (file_hash, sections, section_hashes), where file_hash is the SHA256 of the raw
+    bytes ("" if the file doesn't exist), so all three always describe the same content.
+    """
+    file_hash, sections, section_hashes = _parse_sections(file_path)
+    return file_hash, dict(sections), dict(section_hashes)
+
+
+def parse_markdown_sections(file_path: Path) -> dict[str, str]:
+    """
+    Parse markdown file into sections based on H2 headers (##).
+
+    Returns dict mapping section names to their content (excluding the header itself).
+    Parsing is cached by file content, so re-reading an unchanged file skips the scan.
+    """
+    _, sections, _ = _parse_sections(file_path)
+    return dict(sections)
+
+
+def parse_markdown_section_hashes(file_path: Path) -> dict[str, str]:
+    """
+    Parse markdown file into per-section hashes.
+
+    Returns dict mapping section names to compute_section_hash() of their content.
+    """
+    _, _, section_hashes = _parse_sections(file_path)
+    return dict(section_hashes)
 
 
 def create_metadata(target_file: Path, sections: dict[str, str]) -> None:
     """Create metadata file tracking section hashes."""
+    create_metadata_from_hashes(
+        target_file, {name: compute_section_hash(content) for name, content in sections.items()}
+    )
+
+
+def create_metadata_from_hashes(target_file: Path, section_hashes: dict[str, str]) -> None:
+    """Create metadata file from precomputed hashes, e.g. parse_markdown_section_hashes()."""
     metadata = {
         "version": "1.0.0",
-        "installed_at": datetime.utcnow().isoformat() + "Z",
+        "installed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "source_repo": "ai-tooling",
-        "sections": {name: compute_section_hash(content) for name, content in sections.items()},
+        "sections": dict(section_hashes),
     }
+    save_metadata(target_file, metadata)
 
-    # Store metadata in .ai-tooling directory
-    metadata_dir = target_file.parent / ".ai-tooling"
-    metadata_dir.mkdir(exist_ok=True)
-    metadata_file = metadata_dir / f"{target_file.name}.meta.json"
-    metadata_file.write_text(json.dumps(metadata, indent=2))
 
+def _meta_path(target_file: Path) -> Path:
+    """Return the metadata file tracking a target, stored in a sibling .ai-tooling directory."""
+    return target_file.parent / ".ai-tooling" / f"{target_file.name}.meta.json"
 
-def load_metadata(target_file: Path) -> dict[str, Any] | None:
-    """Load metadata file if it exists."""
-    metadata_dir = target_file.parent / ".ai-tooling"
-    metadata_file = metadata_dir / f"{target_file.name}.meta.json"
 
-    if not metadata_file.exists():
-        return None
+def save_metadata(target_file: Path, metadata: dict[str, Any]) -> None:
+    """Write metadata for a target file, replacing any existing metadata."""
+    metadata_file = _meta_path(target_file)
+    metadata_file.parent.mkdir(exist_ok=True)
+    _atomic_write_text(metadata_file, json.dumps(metadata, separators=(",", ":")))
 
+
+def load_metadata(target_file: Path) -> dict[str, Any] | None:
+    """Load metadata file if it exists."""
     try:
-        data: dict[str, Any] = json.loads(metadata_file.read_text())
+        # A missing file surfaces as OSError, so no separate exists() check is needed
+        data: dict[str, Any] = json.loads(_meta_path(target_file).read_bytes())
         return data
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         return None
 
 
 def update_metadata_hash(target_file: Path, section_name: str, new_hash: str) -> None:
-    """Update the hash for a specific section in metadata."""
-    metadata_dir = target_file.parent / ".ai-tooling"
-    metadata_file = metadata_dir / f"{target_file.name}.meta.json"
+    """Update the hash for a specific section in metadata.
 
-    if not metadata_file.exists():
+    Prefer load_metadata()/save_metadata() when updating several sections at once.
+    """
+    metadata = load_metadata(target_file)
+    if metadata is None:
         return
 
     try:
-        metadata = json.loads(metadata_file.read_text())
         metadata["sections"][section_name] = new_hash
-        metadata_file.write_text(json.dumps(metadata, indent=2))
-    except (json.JSONDecodeError, OSError, KeyError):
+        save_metadata(target_file, metadata)
+    except (OSError, KeyError):
         pass
 
 
@@ -0,0 +1,61 @@
+"""Tests for installation functions."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_tooling import install
+from ai_tooling.install import get_global_targets, install_global_files
+from ai_tooling.utils import load_metadata
+
+
+def test_get_global_targets_symlinked_targets(tmp_path, monkeypatch):
+    """Test global targets that resolve to the same file are only listed once."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    claude_file = tmp_path / ".claude" / "CLAUDE.md"
+    claude_file.parent.mkdir()
+    claude_file.touch()
+    (tmp_path / ".gemini").mkdir()
+    (tmp_path / ".gemini" / "GEMINI.md").symlink_to(claude_file)
+
+    targets = get_global_targets()
+
+    assert list(targets) == [str(claude_file), str(tmp_path / ".codex" / "AGENTS.md")]
+    assert targets[str(claude_file)] == "GLOBAL.md"
+
+
+def test_install_global_files_reports_in_config_order(tmp_path, monkeypatch, capsys):
+    """Test every global target is installed and reported in config order."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    install_template = install._install_template
+    targets = list(get_global_targets())
+
+    def _slow_first_install(template_name, target_path):
+        # Finish the first target last, so output order can't follow completion order
+        if target_path == targets[0]:
+            time.sleep(0.05)
+        return install_template(template_name, target_path)
+
+    monkeypatch.setattr(install, "_install_template", _slow_first_install)
+
+    install_global_files()
+
+    installed = [
+        line.split("Installed: ", 1)[1]
+        for line in capsys.readouterr().out.splitlines()
+        if "Installed: " in line
+    ]
+    assert installed == targets
+    for target in targets:
+        assert load_metadata(Path(target)) is not None
+
+
+def test_install_global_files_missing_template(tmp_path, monkeypatch):
+    """Test a global target with a missing template raises FileNotFoundError."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = {"tools": {"tool": {"global": {"path": "~/TOOL.md", "source_template": "MISSING.md"}}}}
+    monkeypatch.setattr(install, "load_tool_mappings", lambda: config)
+
+    with pytest.raises(FileNotFoundError, match="MISSING.md"):
+        install_global_files()
@@ -0,0 +1,210 @@
+"""Tests for update functions."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ai_tooling import update
+from ai_tooling.update import replace_section_in_file, update_file
+from ai_tooling.utils import (
+    create_metadata_from_hashes,
+    load_metadata,
+    parse_markdown_section_hashes,
+)
+
+
+@pytest.fixture
+def install(tmp_path, monkeypatch):
+    """Install a template into a temporary repo and project, returning (template, target)."""
+    repo_root = tmp_path / "repo"
+    (repo_root / "templates").mkdir(parents=True)
+    monkeypatch.setattr(update, "get_repo_root", lambda: repo_root)
+
+    def _install(content):
+        template = repo_root / "templates" / "TEMPLATE.md"
+        template.write_text(content)
+        target = tmp_path / "project" / "AGENTS.md"
+        target.parent.mkdir(exist_ok=True)
+        target.write_text(content)
+        create_metadata_from_hashes(target, parse_markdown_section_hashes(template))
+        return template, target
+
+    return _install
+
+
+@pytest.fixture
+def target_writes(monkeypatch):
+    """Record every Path.write_text() call, returning the list of written paths."""
+    written = []
+    write_text = Path.write_text
+
+    def _write_text(self, *args, **kwargs):
+        written.append(self)
+        return write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", _write_text)
+    return written
+
+
+def test_replace_section_in_file(tmp_path):
+    """Test replacing a section keeps its header and every other section."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Title\n\n## Section One\n\nOld content\n\n## Section Two\n\nKeep me\n")
+
+    replace_section_in_file(test_file, "Section One", "\nNew content\n")
+
+    assert test_file.read_text() == (
+        "# Title\n\n## Section One\n\nNew content\n\n## Section Two\n\nKeep me\n"
+    )
+
+
+def test_replace_section_in_file_last_section(tmp_path):
+    """Test replacing the final section runs to the end of the file."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("## Section One\n\nKeep me\n\n## Section Two\n\nOld content\n")
+
+    replace_section_in_file(test_file, "Section Two", "\nNew content\n")
+
+    assert test_file.read_text() == "## Section One\n\nKeep me\n\n## Section Two\n\nNew content\n"
+
+
+def test_replace_section_in_file_missing_section(tmp_path):
+    """Test replacing a section that doesn't exist leaves the file unchanged."""
+    test_file = tmp_path / "test.md"
+    content = "## Section One\n\nContent\n"
+    test_file.write_text(content)
+
+    replace_section_in_file(test_file, "Missing", "New content")
+
+    assert test_file.read_text() == content
+
+
+def test_replace_section_in_file_parser_header_rules(tmp_path):
+    """Test sections are matched like parse_markdown_sections(), ignoring trailing whitespace."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("## Section One \nOld content\n# Not a section\n## Section Two\nKeep me\n")
+
+    replace_section_in_file(test_file, "Section One", "New content")
+
+    assert test_file.read_text() == "## Section One \nNew content\n## Section Two\nKeep me\n"
+
+
+def test_update_file_skips_unchanged_template(install):
+    """Test a fully updated file is not re-checked until the template changes."""
+    template, target = install("## A\nold A\n")
+    template.write_text("## A\nnew A\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+    assert update_file(str(target), "TEMPLATE.md") == (0, 0, [])
+
+    template.write_text("## A\nnewer A\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+    assert target.read_text() == "## A\nnewer A\n"
+
+
+def test_update_file_same_size_template_rewrite(install):
+    """Test a same-size template rewrite within one mtime tick is applied, not skipped."""
+    template, target = install("## A\nold A\n")
+    template.write_text("## A\nnew A\n")
+    stat = template.stat()
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+
+    template.write_text("## A\nnow A\n")
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+    assert target.read_text() == "## A\nnow A\n"
+    assert update_file(str(target), "TEMPLATE.md") == (0, 0, [])
+
+
+def test_update_file_applies_template_after_user_reverts_section(install):
+    """Test a skipped section is updated once reverted, even with an unchanged template."""
+    template, target = install("## A\nold A\n## B\nold B\n")
+    template.write_text("## A\nnew A\n## B\nnew B\n")
+    target.write_text("## A\nold A\n## B\nmine\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 1, ["B"])
+    assert update_file(str(target), "TEMPLATE.md") == (1, 1, ["B"])
+
+    target.write_text("## A\nnew A\n## B\nold B\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (2, 0, [])
+    assert target.read_text() == "## A\nnew A\n## B\nnew B\n"
+
+
+def test_update_file_keeps_reporting_new_sections(install, capsys):
+    """Test new template sections are reported on every run."""
+    template, target = install("## A\nold A\n")
+    template.write_text("## A\nold A\n## C\nnew C\n")
+
+    update_file(str(target), "TEMPLATE.md")
+    update_file(str(target), "TEMPLATE.md")
+
+    assert capsys.readouterr().out.count("New section found: C") == 2
+
+
+def test_update_file_dry_run(install):
+    """Test a dry run reports updates without touching the target or its metadata."""
+    template, target = install("## A\nold A\n")
+    template.write_text("## A\nnew A\n")
+    metadata = load_metadata(target)
+
+    assert update_file(str(target), "TEMPLATE.md", dry_run=True) == (1, 0, [])
+    assert update_file(str(target), "TEMPLATE.md", dry_run=True) == (1, 0, [])
+    assert target.read_text() == "## A\nold A\n"
+    assert load_metadata(target) == metadata
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+    assert target.read_text() == "## A\nnew A\n"
+
+
+def test_update_file_updates_unmodified_sections(install, target_writes):
+    """Test every unmodified section is updated in a single write of the target."""
+    template, target = install("# Title\n## A\nold A\n## B\nold B\n## C\nold C\n")
+    template.write_text("# Title\n## A\nnew A\n## B\nold B\n## C\nnew C\n")
+    target_writes.clear()
+
+    assert update_file(str(target), "TEMPLATE.md") == (3, 0, [])
+    assert target.read_text() == template.read_text()
+    assert target_writes.count(target) == 1
+    assert load_metadata(target)["sections"] == parse_markdown_section_hashes(template)
+
+
+def test_update_file_skips_modified_sections(install):
+    """Test user-modified sections are left alone and keep their original hashes."""
+    template, target = install("## A\nold A\n## B\nold B\n")
+    original_hashes = parse_markdown_section_hashes(template)
+    template.write_text("## A\nnew A\n## B\nnew B\n")
+    target.write_text("## A\nold A\n## B\nmine\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 1, ["B"])
+    assert target.read_text() == "## A\nnew A\n## B\nmine\n"
+
+    section_hashes = load_metadata(target)["sections"]
+    assert section_hashes["A"] == parse_markdown_section_hashes(template)["A"]
+    assert section_hashes["B"] == original_hashes["B"]
+
+
+def test_update_file_unchanged_sections_not_rewritten(install, target_writes):
+    """Test the target isn't rewritten when the updated sections already match it."""
+    template, target = install("## A\nsame A\n## B\nold B\n")
+    template.write_text("## A\nsame A\n## B\nnew B\n")
+    target.write_text("## A\nsame A\n## B\nmine\n")
+    target_writes.clear()
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 1, ["B"])
+    assert target.read_text() == "## A\nsame A\n## B\nmine\n"
+    assert target not in target_writes
+
+
+def test_update_file_header_with_trailing_whitespace(install):
+    """Test sections whose headers have trailing whitespace are still updated."""
+    template, target = install("## A \nold A\n")
+    template.write_text("## A \nnew A\n")
+
+    assert update_file(str(target), "TEMPLATE.md") == (1, 0, [])
+    assert target.read_text() == "## A \nnew A\n"
+    assert load_metadata(target)["sections"] == parse_markdown_section_hashes(template)
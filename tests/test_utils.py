@@ -1,8 +1,17 @@
 """Tests for utility functions."""
 
+import hashlib
+import os
 from pathlib import Path
 
-from ai_tooling.utils import compute_section_hash, parse_markdown_sections
+from ai_tooling.utils import (
+    compute_section_hash,
+    create_metadata,
+    load_metadata,
+    parse_markdown_file,
+    parse_markdown_section_hashes,
+    parse_markdown_sections,
+)
 
 
 def test_compute_section_hash():
@@ -57,3 +66,83 @@ def test_parse_markdown_sections_nonexistent_file():
     """Test parsing a non-existent file returns empty dict."""
     sections = parse_markdown_sections(Path("/nonexistent/file.md"))
     assert sections == {}
+
+
+def test_parse_markdown_sections_reflects_file_changes(tmp_path):
+    """Test re-parsing picks up content written after a previous parse."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("## Section One\n\nOriginal\n")
+
+    assert "Original" in parse_markdown_sections(test_file)["Section One"]
+
+    test_file.write_text("## Section One\n\nRewritten content\n")
+
+    assert "Rewritten content" in parse_markdown_sections(test_file)["Section One"]
+
+
+def test_parse_markdown_sections_same_size_rewrite(tmp_path):
+    """Test a same-size rewrite within one mtime tick is still picked up."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("## Section One\n\nOld\n")
+    stat = test_file.stat()
+
+    assert parse_markdown_sections(test_file)["Section One"] == "\nOld\n"
+
+    test_file.write_text("## Section One\n\nNew\n")
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert parse_markdown_sections(test_file)["Section One"] == "\nNew\n"
+
+
+def test_parse_markdown_section_hashes(tmp_path):
+    """Test section hashes match hashing each parsed section's content."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Title\n\n## Empty\n## Section One\n\nLine one\nLine two\n")
+
+    sections = parse_markdown_sections(test_file)
+    hashes = parse_markdown_section_hashes(test_file)
+
+    assert hashes.keys() == sections.keys()
+    for name, content in sections.items():
+        assert hashes[name] == compute_section_hash(content)
+
+
+def test_parse_markdown_file(tmp_path):
+    """Test the file hash, sections and section hashes all come from the same content."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Title\n## Section One\nContent\n")
+
+    file_hash, sections, hashes = parse_markdown_file(test_file)
+
+    assert file_hash == hashlib.sha256(test_file.read_bytes()).hexdigest()
+    assert sections == parse_markdown_sections(test_file)
+    assert hashes == parse_markdown_section_hashes(test_file)
+
+
+def test_parse_markdown_sections_crlf_line_endings(tmp_path):
+    """Test CRLF files parse the same as LF files."""
+    lf_file = tmp_path / "lf.md"
+    crlf_file = tmp_path / "crlf.md"
+    content = "# Title\n\n## Section One\n\nContent\n\n## Section Two\nMore\n"
+    lf_file.write_bytes(content.encode())
+    crlf_file.write_bytes(content.replace("\n", "\r\n").encode())
+
+    assert parse_markdown_sections(crlf_file) == parse_markdown_sections(lf_file)
+
+
+def test_parse_markdown_sections_without_h2_headers(tmp_path):
+    """Test a file with no H2 headers has no sections."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Title\n\nIntro only\n\n### Not tracked\n")
+
+    assert parse_markdown_sections(test_file) == {}
+
+
+def test_create_metadata_hashes_section_content(tmp_path):
+    """Test create_metadata() records the hash of each section's content."""
+    target = tmp_path / "AGENTS.md"
+    target.write_text("## Section One\nContent\n")
+
+    create_metadata(target, parse_markdown_sections(target))
+
+    assert load_metadata(target)["sections"] == parse_markdown_section_hashes(target)